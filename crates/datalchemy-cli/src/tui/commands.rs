@@ -1,5 +1,4 @@
 use std::path::{Path, PathBuf};
-use std::time::Duration;
 
 use chrono::Utc;
 use serde_json::Value;
@@ -12,7 +11,7 @@ use datalchemy_introspect::{
 };
 use datalchemy_plan::{
     ColumnGeneratorRule, GeneratorRef, PLAN_VERSION, Plan, PlanGlobal, Rule, SchemaRef, Target,
-    validate_plan, validate_plan_against_schema, validate_plan_json,
+    validate_bundled_plan, validate_bundled_plan_json, validate_plan_against_schema,
 };
 
 use crate::CliError;
@@ -28,9 +27,11 @@ use crate::workspace::{
     load_or_create_llm_models, load_or_create_profiles, load_or_create_settings, new_artifact_id,
     run_doctor, save_profiles, save_settings, write_bytes_atomic, write_json_atomic,
 };
-use sqlx::{Row, postgres::PgPoolOptions};
+use sqlx::Row;
 
-use crate::tui::conn::{is_sqlite, is_supported_connection};
+use crate::tui::conn::{
+    PoolPurpose, connect_postgres, connect_sqlite, is_sqlite, is_supported_connection,
+};
 
 pub fn execute_command(app: &mut App, input: &str, bypass_approval: bool) -> Result<(), CliError> {
     let mut parts = input.split_whitespace();
@@ -523,12 +524,9 @@ fn cmd_db(app: &mut App, args: Vec<&str>) -> Result<(), CliError> {
             let is_sq = is_sqlite(&conn);
             app.runtime.spawn(async move {
                 if is_sq {
-                    match sqlx::sqlite::SqlitePoolOptions::new()
-                        .acquire_timeout(std::time::Duration::from_secs(5))
-                        .connect(&conn)
-                        .await
-                    {
-                        Ok(_) => {
+                    match connect_sqlite(&conn, PoolPurpose::Probe).await {
+                        Ok(pool) => {
+                            pool.close().await;
                             tx.send(AppEvent::Log("Connection successful!".into())).ok();
                         }
                         Err(e) => {
@@ -537,12 +535,9 @@ fn cmd_db(app: &mut App, args: Vec<&str>) -> Result<(), CliError> {
                         }
                     }
                 } else {
-                    match PgPoolOptions::new()
-                        .acquire_timeout(std::time::Duration::from_secs(5))
-                        .connect(&conn)
-                        .await
-                    {
-                        Ok(_) => {
+                    match connect_postgres(&conn, PoolPurpose::Probe).await {
+                        Ok(pool) => {
+                            pool.close().await;
                             tx.send(AppEvent::Log("Connection successful!".into())).ok();
                         }
                         Err(e) => {
@@ -566,14 +561,12 @@ fn cmd_db(app: &mut App, args: Vec<&str>) -> Result<(), CliError> {
             let is_sq = is_sqlite(&conn);
             app.runtime.spawn(async move {
                 if is_sq {
-                    match sqlx::sqlite::SqlitePoolOptions::new()
-                        .acquire_timeout(std::time::Duration::from_secs(5))
-                        .connect(&conn)
-                        .await
-                    {
+                    match connect_sqlite(&conn, PoolPurpose::Probe).await {
                         Ok(pool) => {
                             let q = sqlx::query("SELECT sqlite_version() AS ver");
-                            match q.fetch_one(&pool).await {
+                            let result = q.fetch_one(&pool).await;
+                            pool.close().await;
+                            match result {
                                 Ok(row) => {
                                     let ver: String = row.try_get("ver").unwrap_or_default();
                                     tx.send(AppEvent::Log(format!("Engine: SQLite, Ver: {}", ver)))
@@ -590,15 +583,13 @@ fn cmd_db(app: &mut App, args: Vec<&str>) -> Result<(), CliError> {
                         }
                     }
                 } else {
-                    match PgPoolOptions::new()
-                        .acquire_timeout(std::time::Duration::from_secs(5))
-                        .connect(&conn)
-                        .await
-                    {
+                    match connect_postgres(&conn, PoolPurpose::Probe).await {
                         Ok(pool) => {
                             let q =
                                 sqlx::query("SELECT current_user, current_database(), version()");
-                            match q.fetch_one(&pool).await {
+                            let result = q.fetch_one(&pool).await;
+                            pool.close().await;
+                            match result {
                                 Ok(row) => {
                                     let user: String =
                                         row.try_get("current_user").unwrap_or_default();
@@ -705,21 +696,15 @@ fn cmd_introspect(
     let is_sq = is_sqlite(&conn);
     let result = app.runtime.block_on(async {
         if is_sq {
-            let pool = sqlx::sqlite::SqlitePoolOptions::new()
-                .max_connections(5)
-                .acquire_timeout(Duration::from_secs(10))
-                .connect(&conn)
-                .await?;
-            let schema = introspect_sqlite_with_options(&pool, options).await?;
-            Ok::<DatabaseSchema, CliError>(schema)
+            let pool = connect_sqlite(&conn, PoolPurpose::Introspect).await?;
+            let schema = introspect_sqlite_with_options(&pool, options).await;
+            pool.close().await;
+            Ok::<DatabaseSchema, CliError>(schema?)
         } else {
-            let pool = sqlx::postgres::PgPoolOptions::new()
-                .max_connections(5)
-                .acquire_timeout(Duration::from_secs(10))
-                .connect(&conn)
-                .await?;
-            let schema = introspect_postgres_with_options(&pool, options).await?;
-            Ok::<DatabaseSchema, CliError>(schema)
+            let pool = connect_postgres(&conn, PoolPurpose::Introspect).await?;
+            let schema = introspect_postgres_with_options(&pool, options).await;
+            pool.close().await;
+            Ok::<DatabaseSchema, CliError>(schema?)
         }
     });
     app.finish_task();
@@ -729,6 +714,7 @@ fn cmd_introspect(
             validate_schema(&schema)?;
             let metrics = collect_schema_metrics(&schema);
             write_json_atomic(&run_dir.join("schema.json"), &schema)?;
+            app.invalidate_run_schema(&run_id);
             write_json_atomic(&run_dir.join("metrics.json"), &metrics)?;
 
             if strict && metrics.fk_graph.has_cycle {
@@ -896,6 +882,7 @@ fn cmd_runs(
                 return Ok(());
             }
             std::fs::remove_dir_all(&run_dir)?;
+            app.invalidate_run_schema(run_id);
             if app.settings.active_run_id.as_deref() == Some(run_id) {
                 app.settings.active_run_id = None;
                 save_settings(&app.paths, &app.settings)?;
@@ -998,8 +985,7 @@ fn cmd_plan_new(
         return app.request_approval(intent, &command_with_id(raw, "--plan-id", &plan_id));
     }
 
-    let schema_path = app.paths.runs_dir.join(&run_id).join("schema.json");
-    let schema = read_schema(&schema_path)?;
+    let schema = app.run_schema(&run_id)?;
 
     let plan_dir = app.paths.plans_dir.join(&plan_id);
     std::fs::create_dir_all(&plan_dir)?;
@@ -1182,11 +1168,10 @@ fn cmd_plan_validate(app: &mut App) -> Result<(), CliError> {
     }
 
     let plan_json: Value = serde_json::from_str(&std::fs::read_to_string(&plan_path)?)?;
-    let schema = read_schema(&schema_path)?;
+    let schema = app.run_schema(&run_id)?;
 
-    let plan_schema = serde_json::to_value(datalchemy_plan::plan_json_schema())?;
-    let mut report = validate_plan_json(&plan_json, &plan_schema)
-        .map_err(|err| CliError::Plan(err.to_string()))?;
+    let mut report =
+        validate_bundled_plan_json(&plan_json).map_err(|err| CliError::Plan(err.to_string()))?;
     let schema_report = validate_plan_against_schema(&parse_plan(&plan_json)?, &schema);
     report.merge(schema_report);
 
@@ -1243,10 +1228,9 @@ fn cmd_generate(
         return Ok(());
     }
 
-    let schema = read_schema(&schema_path)?;
+    let schema = app.run_schema(&run_id)?;
     let plan_json: Value = serde_json::from_str(&std::fs::read_to_string(&plan_path)?)?;
-    let plan_schema = serde_json::to_value(datalchemy_plan::plan_json_schema())?;
-    let validated = validate_plan(&plan_json, &plan_schema, &schema)
+    let validated = validate_bundled_plan(&plan_json, &schema)
         .map_err(|_| CliError::Plan("plan validation failed".to_string()))?;
     let plan = validated.plan;
 
@@ -1430,7 +1414,7 @@ fn cmd_eval(
         return Ok(());
     }
 
-    let schema = read_schema(&schema_path)?;
+    let schema = app.run_schema(&run_id)?;
     let plan_json: Value = serde_json::from_str(&std::fs::read_to_string(&plan_path)?)?;
     let plan = parse_plan(&plan_json)?;
 
@@ -1794,12 +1778,6 @@ pub fn parse_introspect_options(args: &[&str]) -> IntrospectOptions {
     options
 }
 
-fn read_schema(path: &Path) -> Result<DatabaseSchema, CliError> {
-    let content = std::fs::read_to_string(path)?;
-    let schema: DatabaseSchema = serde_json::from_str(&content)?;
-    Ok(schema)
-}
-
 fn parse_plan(plan_json: &Value) -> Result<Plan, CliError> {
     serde_json::from_value(plan_json.clone()).map_err(|err| CliError::Plan(err.to_string()))
 }
@@ -1,4 +1,9 @@
-//! Connection-string helpers shared across TUI modules.
+//! Connection-string and pool helpers shared across TUI modules.
+
+use std::time::Duration;
+
+use sqlx::postgres::{PgPool, PgPoolOptions};
+use sqlx::sqlite::{SqlitePool, SqlitePoolOptions};
 
 /// Returns `true` when the connection string uses a supported database engine.
 pub fn is_supported_connection(conn: &str) -> bool {
@@ -11,3 +16,46 @@ pub fn is_supported_connection(conn: &str) -> bool {
 pub fn is_sqlite(conn: &str) -> bool {
     conn.starts_with("sqlite://")
 }
+
+/// How a pool is going to be used; sizing and timeouts follow from it.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum PoolPurpose {
+    /// One-off probe (`/db test`, `/db privileges`, schema listing).
+    Probe,
+    /// Full introspection issuing many catalog queries.
+    Introspect,
+}
+
+impl PoolPurpose {
+    fn max_connections(self) -> u32 {
+        match self {
+            PoolPurpose::Probe => 1,
+            PoolPurpose::Introspect => 5,
+        }
+    }
+
+    fn acquire_timeout(self) -> Duration {
+        match self {
+            PoolPurpose::Probe => Duration::from_secs(5),
+            PoolPurpose::Introspect => Duration::from_secs(10),
+        }
+    }
+}
+
+/// Open a Postgres pool sized for `purpose`. Callers close it when done.
+pub async fn connect_postgres(conn: &str, purpose: PoolPurpose) -> Result<PgPool, sqlx::Error> {
+    PgPoolOptions::new()
+        .max_connections(purpose.max_connections())
+        .acquire_timeout(purpose.acquire_timeout())
+        .connect(conn)
+        .await
+}
+
+/// Open a SQLite pool sized for `purpose`. Callers close it when done.
+pub async fn connect_sqlite(conn: &str, purpose: PoolPurpose) -> Result<SqlitePool, sqlx::Error> {
+    SqlitePoolOptions::new()
+        .max_connections(purpose.max_connections())
+        .acquire_timeout(purpose.acquire_timeout())
+        .connect(conn)
+        .await
+}
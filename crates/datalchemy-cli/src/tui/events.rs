@@ -1,9 +1,8 @@
 use crossterm::event::{KeyCode, KeyEvent, KeyModifiers};
-use sqlx::postgres::PgPoolOptions;
 
 use crate::CliError;
 use crate::tui::commands::{command_palette_matches, execute_command, sanitize_command_for_log};
-use crate::tui::conn::is_supported_connection;
+use crate::tui::conn::{PoolPurpose, connect_postgres, connect_sqlite, is_supported_connection};
 use crate::tui::state::{App, AppEvent, InputMode, SetupStep, UiState};
 use crate::workspace::{DbProfile, WriteIntent, save_profiles, save_settings};
 use datalchemy_core::validate_schema;
@@ -281,6 +280,7 @@ fn handle_setup_input(app: &mut App, input: &str) -> Result<(), CliError> {
                 app.setup_profile_name = None;
                 app.settings = crate::workspace::WorkspaceSettings::default();
                 app.profiles = crate::workspace::ProfilesConfig::default();
+                app.clear_run_schemas();
                 app.ui_state = UiState::Setup(SetupStep::Welcome);
             } else if matches!(input, "n" | "N") {
                 app.ui_state = UiState::Normal;
@@ -346,11 +346,9 @@ fn handle_setup_input(app: &mut App, input: &str) -> Result<(), CliError> {
             app.runtime.spawn(async move {
                 tx.send(AppEvent::Log("Connecting to database...".into())).ok();
                 if is_sqlite {
-                    match sqlx::sqlite::SqlitePoolOptions::new()
-                        .connect(&conn_string)
-                        .await
-                    {
-                        Ok(_pool) => {
+                    match connect_sqlite(&conn_string, PoolPurpose::Probe).await {
+                        Ok(pool) => {
+                            pool.close().await;
                             // SQLite has a single "main" schema, skip schema selection.
                             tx.send(AppEvent::SchemasLoaded(Ok(vec!["main".to_string()])))
                                 .ok();
@@ -364,7 +362,7 @@ fn handle_setup_input(app: &mut App, input: &str) -> Result<(), CliError> {
                         }
                     }
                 } else {
-                    match PgPoolOptions::new().connect(&conn_string).await {
+                    match connect_postgres(&conn_string, PoolPurpose::Probe).await {
                         Ok(pool) => {
                             tx.send(AppEvent::Log("Connected! Fetching schemas...".into())).ok();
                             let schemas_result: Result<Vec<sqlx::postgres::PgRow>, sqlx::Error> =
@@ -377,6 +375,7 @@ fn handle_setup_input(app: &mut App, input: &str) -> Result<(), CliError> {
                             )
                             .fetch_all(&pool)
                             .await;
+                            pool.close().await;
 
                             match schemas_result {
                                 Ok(rows) => {
@@ -468,32 +467,33 @@ fn handle_setup_input(app: &mut App, input: &str) -> Result<(), CliError> {
                 tx.send(AppEvent::Log("Starting introspection...".into()))
                     .ok();
                 if is_sqlite {
-                    match sqlx::sqlite::SqlitePoolOptions::new()
-                        .connect(&conn_string)
-                        .await
-                    {
-                        Ok(pool) => match introspect_sqlite_with_options(&pool, options).await {
-                            Ok(schema) => {
-                                tx.send(AppEvent::Log("Introspection complete.".into()))
-                                    .ok();
-                                if let Err(e) = validate_schema(&schema) {
+                    match connect_sqlite(&conn_string, PoolPurpose::Introspect).await {
+                        Ok(pool) => {
+                            let result = introspect_sqlite_with_options(&pool, options).await;
+                            pool.close().await;
+                            match result {
+                                Ok(schema) => {
+                                    tx.send(AppEvent::Log("Introspection complete.".into()))
+                                        .ok();
+                                    if let Err(e) = validate_schema(&schema) {
+                                        tx.send(AppEvent::IntrospectionDone(Err(format!(
+                                            "Schema validation failed: {}",
+                                            e
+                                        ))))
+                                        .ok();
+                                    } else {
+                                        tx.send(AppEvent::IntrospectionDone(Ok(()))).ok();
+                                    }
+                                }
+                                Err(e) => {
                                     tx.send(AppEvent::IntrospectionDone(Err(format!(
-                                        "Schema validation failed: {}",
+                                        "Introspection error: {}",
                                         e
                                     ))))
                                     .ok();
-                                } else {
-                                    tx.send(AppEvent::IntrospectionDone(Ok(()))).ok();
                                 }
                             }
-                            Err(e) => {
-                                tx.send(AppEvent::IntrospectionDone(Err(format!(
-                                    "Introspection error: {}",
-                                    e
-                                ))))
-                                .ok();
-                            }
-                        },
+                        }
                         Err(e) => {
                             tx.send(AppEvent::IntrospectionDone(Err(format!(
                                 "Connection failed: {}",
@@ -503,29 +503,33 @@ fn handle_setup_input(app: &mut App, input: &str) -> Result<(), CliError> {
                         }
                     }
                 } else {
-                    match PgPoolOptions::new().connect(&conn_string).await {
-                        Ok(pool) => match introspect_postgres_with_options(&pool, options).await {
-                            Ok(schema) => {
-                                tx.send(AppEvent::Log("Introspection complete.".into()))
-                                    .ok();
-                                if let Err(e) = validate_schema(&schema) {
+                    match connect_postgres(&conn_string, PoolPurpose::Introspect).await {
+                        Ok(pool) => {
+                            let result = introspect_postgres_with_options(&pool, options).await;
+                            pool.close().await;
+                            match result {
+                                Ok(schema) => {
+                                    tx.send(AppEvent::Log("Introspection complete.".into()))
+                                        .ok();
+                                    if let Err(e) = validate_schema(&schema) {
+                                        tx.send(AppEvent::IntrospectionDone(Err(format!(
+                                            "Schema validation failed: {}",
+                                            e
+                                        ))))
+                                        .ok();
+                                    } else {
+                                        tx.send(AppEvent::IntrospectionDone(Ok(()))).ok();
+                                    }
+                                }
+                                Err(e) => {
                                     tx.send(AppEvent::IntrospectionDone(Err(format!(
-                                        "Schema validation failed: {}",
+                                        "Introspection error: {}",
                                         e
                                     ))))
                                     .ok();
-                                } else {
-                                    tx.send(AppEvent::IntrospectionDone(Ok(()))).ok();
                                 }
                             }
-                            Err(e) => {
-                                tx.send(AppEvent::IntrospectionDone(Err(format!(
-                                    "Introspection error: {}",
-                                    e
-                                ))))
-                                .ok();
-                            }
-                        },
+                        }
                         Err(e) => {
                             tx.send(AppEvent::IntrospectionDone(Err(format!(
                                 "Connection failed: {}",
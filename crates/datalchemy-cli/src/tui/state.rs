@@ -1,6 +1,10 @@
+use std::collections::BTreeMap;
 use std::path::{Path, PathBuf};
+use std::sync::Arc;
+use std::time::SystemTime;
 
 use chrono::Local;
+use datalchemy_core::DatabaseSchema;
 
 use crate::CliError;
 use crate::tui::secrets::load_env_file;
@@ -114,6 +118,16 @@ pub struct App {
     pub available_schemas: Vec<String>,
     pub schema_picker_idx: usize,
     pub active_task: Option<ActiveTask>,
+    /// Parsed `schema.json` per run id, reused across commands in a session.
+    schema_cache: BTreeMap<String, CachedSchema>,
+}
+
+/// A parsed run schema together with the file stamp it was read from.
+#[derive(Debug, Clone)]
+pub struct CachedSchema {
+    modified: SystemTime,
+    len: u64,
+    schema: Arc<DatabaseSchema>,
 }
 
 impl App {
@@ -163,9 +177,64 @@ impl App {
             available_schemas: Vec::new(),
             schema_picker_idx: 0,
             active_task: None,
+            schema_cache: BTreeMap::new(),
         })
     }
 
+    // -- run artifacts --
+
+    /// Load the `schema.json` captured by a run.
+    ///
+    /// The parsed schema is reused while the file's modification time and size
+    /// are unchanged, so edits made outside the TUI (the `introspect`
+    /// subcommand, manual review) are picked up on the next command.
+    pub fn run_schema(&mut self, run_id: &str) -> Result<Arc<DatabaseSchema>, CliError> {
+        let path = self.paths.runs_dir.join(run_id).join("schema.json");
+        let metadata = std::fs::metadata(&path)?;
+        let modified = metadata.modified().ok();
+        let len = metadata.len();
+
+        if let (Some(modified), Some(cached)) = (modified, self.schema_cache.get(run_id))
+            && cached.modified == modified
+            && cached.len == len
+        {
+            return Ok(Arc::clone(&cached.schema));
+        }
+
+        let content = std::fs::read_to_string(&path)?;
+        let schema: DatabaseSchema = serde_json::from_str(&content)?;
+        let schema = Arc::new(schema);
+        match modified {
+            Some(modified) => {
+                self.schema_cache.insert(
+                    run_id.to_string(),
+                    CachedSchema {
+                        modified,
+                        len,
+                        schema: Arc::clone(&schema),
+                    },
+                );
+            }
+            None => {
+                self.schema_cache.remove(run_id);
+            }
+        }
+        Ok(schema)
+    }
+
+    /// Forget the cached schema of a run. `run_schema` already notices
+    /// rewrites by mtime and size; this covers writes that land within the
+    /// filesystem's timestamp granularity with an unchanged size, and frees
+    /// entries for deleted runs.
+    pub fn invalidate_run_schema(&mut self, run_id: &str) {
+        self.schema_cache.remove(run_id);
+    }
+
+    /// Forget every cached run schema, e.g. when the workspace is reset.
+    pub fn clear_run_schemas(&mut self) {
+        self.schema_cache.clear();
+    }
+
     // -- input helpers (cursor-aware) --
 
     pub fn input_insert_char(&mut self, ch: char) {
@@ -416,3 +485,48 @@ impl App {
         self.active_task = None;
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn write_schema(path: &Path, database: &str) {
+        let schema = DatabaseSchema {
+            schema_version: datalchemy_core::SCHEMA_VERSION.to_string(),
+            engine: "sqlite".to_string(),
+            database: Some(database.to_string()),
+            schemas: Vec::new(),
+            enums: Vec::new(),
+            schema_fingerprint: None,
+        };
+        let json = serde_json::to_vec_pretty(&schema).expect("serialize schema");
+        std::fs::write(path, json).expect("write schema.json");
+    }
+
+    #[test]
+    fn run_schema_reloads_rewritten_schema_json() {
+        let root =
+            std::env::temp_dir().join(format!("datalchemy-schema-cache-{}", std::process::id()));
+        let runtime = tokio::runtime::Runtime::new().expect("runtime");
+        let (tx, _rx) = tokio::sync::mpsc::unbounded_channel();
+        let mut app = App::new(runtime.handle().clone(), root.clone(), tx).expect("app");
+
+        let run_dir = app.paths.runs_dir.join("run-1");
+        std::fs::create_dir_all(&run_dir).expect("create run dir");
+        let schema_path = run_dir.join("schema.json");
+
+        write_schema(&schema_path, "first");
+        let first = app.run_schema("run-1").expect("first load");
+        assert_eq!(first.database.as_deref(), Some("first"));
+        let cached = app.run_schema("run-1").expect("cached load");
+        assert!(Arc::ptr_eq(&first, &cached));
+
+        // Rewritten outside the TUI: a different size is detected even when
+        // the mtime granularity hides the change.
+        write_schema(&schema_path, "second-database");
+        let second = app.run_schema("run-1").expect("reload");
+        assert_eq!(second.database.as_deref(), Some("second-database"));
+
+        let _ = std::fs::remove_dir_all(&root);
+    }
+}
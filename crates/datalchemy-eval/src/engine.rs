@@ -4,6 +4,7 @@ use std::time::Instant;
 
 use chrono::{NaiveDate, NaiveDateTime, NaiveTime};
 use datalchemy_core::{CheckConstraint, ColumnType, Constraint, DatabaseSchema, ForeignKey};
+use datalchemy_generate::artifacts::write_json_pretty;
 use datalchemy_generate::checks::{CheckContext, CheckOutcome, evaluate_check};
 use datalchemy_generate::generators::GeneratedValue;
 use datalchemy_generate::model::GenerationReport;
@@ -161,14 +162,14 @@ impl EvaluationEngine {
         std::fs::create_dir_all(&out_dir)?;
 
         let metrics_path = out_dir.join("metrics.json");
-        std::fs::write(&metrics_path, serde_json::to_vec_pretty(&metrics)?)?;
+        write_json_pretty(&metrics_path, &metrics)?;
 
         let report_path = out_dir.join("report.md");
         std::fs::write(&report_path, report.as_bytes())?;
 
         let violations_path = if self.options.write_violations {
             let path = out_dir.join("violations.json");
-            std::fs::write(&path, serde_json::to_vec_pretty(&violations)?)?;
+            write_json_pretty(&path, &violations)?;
             Some(path)
         } else {
             None
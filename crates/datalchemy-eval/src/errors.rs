@@ -1,3 +1,4 @@
+use datalchemy_generate::artifacts::JsonWriteError;
 use thiserror::Error;
 
 /// Errors emitted by the evaluation engine.
@@ -14,3 +15,12 @@ pub enum EvalError {
     #[error("json error: {0}")]
     Json(#[from] serde_json::Error),
 }
+
+impl From<JsonWriteError> for EvalError {
+    fn from(err: JsonWriteError) -> Self {
+        match err {
+            JsonWriteError::Io(err) => Self::Io(err),
+            JsonWriteError::Json(err) => Self::Json(err),
+        }
+    }
+}
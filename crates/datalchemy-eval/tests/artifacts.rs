@@ -0,0 +1,28 @@
+use std::collections::BTreeMap;
+use std::fs;
+
+use datalchemy_eval::EvalError;
+use datalchemy_generate::artifacts::write_json_pretty;
+
+#[test]
+fn artifact_serialization_failure_maps_to_json_error() {
+    let dir =
+        std::env::temp_dir().join(format!("datalchemy_eval_artifacts_{}", std::process::id()));
+    fs::create_dir_all(&dir).expect("create temp dir");
+    // JSON object keys must be strings; tuple keys fail during serialization.
+    let mut value = BTreeMap::new();
+    value.insert((1, 2), "x");
+
+    let err = write_json_pretty(&dir.join("metrics.json"), &value).expect_err("must fail");
+    assert!(matches!(EvalError::from(err), EvalError::Json(_)));
+}
+
+#[test]
+fn artifact_filesystem_failure_maps_to_io_error() {
+    let path = std::env::temp_dir()
+        .join(format!("datalchemy_eval_missing_{}", std::process::id()))
+        .join("metrics.json");
+
+    let err = write_json_pretty(&path, &vec![1, 2, 3]).expect_err("must fail");
+    assert!(matches!(EvalError::from(err), EvalError::Io(_)));
+}
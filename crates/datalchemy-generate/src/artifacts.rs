@@ -0,0 +1,43 @@
+//! Writers for run artifacts (`resolved_plan.json`, `generation_report.json`,
+//! evaluation metrics and violations). Dataset output lives in [`crate::output`].
+
+use std::fs::File;
+use std::io::{BufWriter, Write};
+use std::path::Path;
+
+use serde::Serialize;
+use thiserror::Error;
+
+/// Failure while writing a JSON artifact, split so callers keep reporting
+/// filesystem and serialization problems under their own error variants.
+#[derive(Debug, Error)]
+pub enum JsonWriteError {
+    #[error("io error: {0}")]
+    Io(#[from] std::io::Error),
+    #[error("json error: {0}")]
+    Json(serde_json::Error),
+}
+
+impl From<serde_json::Error> for JsonWriteError {
+    fn from(err: serde_json::Error) -> Self {
+        // Streaming surfaces write failures as serde_json io errors; report
+        // them as io like the buffered write did.
+        if err.is_io() {
+            Self::Io(err.into())
+        } else {
+            Self::Json(err)
+        }
+    }
+}
+
+/// Write a JSON artifact, streaming the pretty-printed output to disk instead
+/// of building the whole document in memory first.
+pub fn write_json_pretty<T: Serialize + ?Sized>(
+    path: &Path,
+    value: &T,
+) -> Result<(), JsonWriteError> {
+    let mut writer = BufWriter::new(File::create(path)?);
+    serde_json::to_writer_pretty(&mut writer, value)?;
+    writer.flush()?;
+    Ok(())
+}
@@ -1,10 +1,30 @@
 use std::collections::HashMap;
+use std::sync::LazyLock;
 
 use chrono::NaiveDate;
 use regex::Regex;
 
 use crate::generators::GeneratedValue;
 
+// CHECK expression patterns, compiled once and shared by every evaluation.
+static IS_NULL_OR_RE: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r"(?i)^\s*(\w+)\s+is\s+null\s+or\s+(.+)$").ok());
+static IS_NOT_NULL_RE: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r"(?i)^\s*(\w+)\s+is\s+not\s+null\s*$").ok());
+static IN_LIST_RE: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r"(?i)^\s*(\w+)\s+in\s*\(([^\)]+)\)\s*$").ok());
+static BETWEEN_RE: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r"(?i)^\s*(\w+)\s+between\s+([^\s]+)\s+and\s+([^\s]+)\s*$").ok());
+static COMPARISON_RE: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r"(?i)^\s*(\w+)\s*(=|>=|<=|>|<)\s*([^\s]+)\s*$").ok());
+static POSITION_RE: LazyLock<Option<Regex>> = LazyLock::new(|| {
+    Regex::new(
+        r"(?i)^\s*position\(\(?\s*'\s*([^']*)\s*'(?:::text)?\s*\)?\s+in\s+\(?\s*(\w+)\s*\)?\s*\)\s*(=|>=|<=|>|<)\s*(\d+)\s*$",
+    ).ok()
+});
+static ANY_ARRAY_RE: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r"(?i)^\s*(\w+)\s*=\s*any\s*\(array\[([^\]]+)\]\)\s*$").ok());
+
 /// Result of evaluating a CHECK constraint expression.
 #[derive(Debug, Clone, PartialEq)]
 pub enum CheckOutcome {
@@ -104,27 +124,23 @@ fn split_and(expr: &str) -> Option<Vec<String>> {
 }
 
 fn parse_is_null_or(expr: &str) -> Option<(String, String)> {
-    let re = Regex::new(r"(?i)^\s*(\w+)\s+is\s+null\s+or\s+(.+)$").ok()?;
-    let caps = re.captures(expr)?;
+    let caps = IS_NULL_OR_RE.as_ref()?.captures(expr)?;
     Some((caps[1].to_lowercase(), caps[2].trim().to_string()))
 }
 
 fn parse_is_not_null(expr: &str) -> Option<(String, String)> {
-    let re = Regex::new(r"(?i)^\s*(\w+)\s+is\s+not\s+null\s*$").ok()?;
-    let caps = re.captures(expr)?;
+    let caps = IS_NOT_NULL_RE.as_ref()?.captures(expr)?;
     Some((caps[1].to_lowercase(), caps[1].to_lowercase()))
 }
 
 fn parse_in_list(expr: &str) -> Option<(String, Vec<String>)> {
-    let re = Regex::new(r"(?i)^\s*(\w+)\s+in\s*\(([^\)]+)\)\s*$").ok()?;
-    let caps = re.captures(expr)?;
+    let caps = IN_LIST_RE.as_ref()?.captures(expr)?;
     let values = caps[2].split(',').map(normalize_literal).collect();
     Some((caps[1].to_lowercase(), values))
 }
 
 fn parse_between(expr: &str) -> Option<(String, String, String)> {
-    let re = Regex::new(r"(?i)^\s*(\w+)\s+between\s+([^\s]+)\s+and\s+([^\s]+)\s*$").ok()?;
-    let caps = re.captures(expr)?;
+    let caps = BETWEEN_RE.as_ref()?.captures(expr)?;
     Some((
         caps[1].to_lowercase(),
         normalize_literal(&caps[2]),
@@ -133,8 +149,7 @@ fn parse_between(expr: &str) -> Option<(String, String, String)> {
 }
 
 fn parse_comparison(expr: &str) -> Option<(String, String, String)> {
-    let re = Regex::new(r"(?i)^\s*(\w+)\s*(=|>=|<=|>|<)\s*([^\s]+)\s*$").ok()?;
-    let caps = re.captures(expr)?;
+    let caps = COMPARISON_RE.as_ref()?.captures(expr)?;
     Some((
         caps[1].to_lowercase(),
         caps[2].to_string(),
@@ -143,11 +158,7 @@ fn parse_comparison(expr: &str) -> Option<(String, String, String)> {
 }
 
 fn parse_position(expr: &str) -> Option<(String, String, String, String)> {
-    let re = Regex::new(
-        r"(?i)^\s*position\(\(?\s*'\s*([^']*)\s*'(?:::text)?\s*\)?\s+in\s+\(?\s*(\w+)\s*\)?\s*\)\s*(=|>=|<=|>|<)\s*(\d+)\s*$",
-    )
-    .ok()?;
-    let caps = re.captures(expr)?;
+    let caps = POSITION_RE.as_ref()?.captures(expr)?;
     Some((
         caps[1].to_string(),
         caps[2].to_lowercase(),
@@ -157,8 +168,7 @@ fn parse_position(expr: &str) -> Option<(String, String, String, String)> {
 }
 
 fn parse_any_array(expr: &str) -> Option<(String, Vec<String>)> {
-    let re = Regex::new(r"(?i)^\s*(\w+)\s*=\s*any\s*\(array\[([^\]]+)\]\)\s*$").ok()?;
-    let caps = re.captures(expr)?;
+    let caps = ANY_ARRAY_RE.as_ref()?.captures(expr)?;
     let values = caps[2].split(',').map(normalize_literal).collect();
     Some((caps[1].to_lowercase(), values))
 }
@@ -1,5 +1,6 @@
 use std::any::Any;
 use std::collections::{BTreeSet, HashMap, HashSet};
+use std::fmt::Write as _;
 use std::path::PathBuf;
 use std::time::Instant;
 
@@ -17,6 +18,7 @@ use datalchemy_plan::{
     ConstraintKind, ConstraintMode, ForeignKeyMode, GeneratorRef, Plan, Rule, TransformRule,
 };
 
+use crate::artifacts::write_json_pretty;
 use crate::checks::{CheckContext, CheckOutcome, evaluate_check};
 use crate::errors::GenerationError;
 use crate::foreign::InMemoryForeignContext;
@@ -27,6 +29,9 @@ use crate::model::{GenerateOptions, GenerationIssue, GenerationReport, TableRepo
 use crate::output::csv::write_table_csv;
 use crate::planner::plan_tables;
 
+/// Upper bound on rows reserved ahead of generation for a single table.
+const MAX_ROWS_PREALLOC: usize = 1 << 16;
+
 /// Result of a generation run.
 #[derive(Debug, Clone)]
 pub struct GenerationResult {
@@ -75,7 +80,7 @@ impl GenerationEngine {
         let base_date = NaiveDate::from_ymd_opt(2024, 1, 1).unwrap_or_default();
 
         let plan_path = run_dir.join("resolved_plan.json");
-        std::fs::write(&plan_path, serde_json::to_vec_pretty(&plan)?)?;
+        write_json_pretty(&plan_path, &plan)?;
 
         let mut report = GenerationReport::new(run_id.clone());
         let mut bytes_written = 0_u64;
@@ -105,8 +110,14 @@ impl GenerationEngine {
                         })?;
                     let table_key = table_key(&schema_name, &table_name);
 
-                    let table_ctx =
-                        TableContext::new(&schema_name, table, schema, &plan_index, base_date);
+                    let table_ctx = TableContext::new(
+                        &schema_name,
+                        table,
+                        schema,
+                        &plan_index,
+                        &enum_index,
+                        base_date,
+                    );
 
                     let table_seed = hash_seed(plan.seed, &table_key);
                     info!(
@@ -169,7 +180,7 @@ impl GenerationEngine {
 
         let report_path = run_dir.join("generation_report.json");
         let write_report = |report: &GenerationReport| -> Result<(), GenerationError> {
-            std::fs::write(&report_path, serde_json::to_vec_pretty(report)?)?;
+            write_json_pretty(&report_path, report)?;
             Ok(())
         };
 
@@ -217,6 +228,11 @@ struct TableContext<'a> {
     numeric_bounds: HashMap<String, NumericBounds>,
     current_date_columns: HashSet<String>,
     email_columns: HashSet<String>,
+    transform_columns: Vec<&'a datalchemy_core::Column>,
+    column_rules: HashMap<&'a str, &'a ColumnRule>,
+    default_generators: HashMap<&'a str, &'static str>,
+    fk_mode: ForeignKeyMode,
+    check_mode: ConstraintMode,
     base_date: NaiveDate,
 }
 
@@ -225,7 +241,8 @@ impl<'a> TableContext<'a> {
         schema_name: &'a str,
         table: &'a Table,
         schema: &'a DatabaseSchema,
-        plan_index: &PlanIndex,
+        plan_index: &'a PlanIndex,
+        enum_index: &EnumIndex,
         base_date: NaiveDate,
     ) -> Self {
         let mut primary_keys = Vec::new();
@@ -258,6 +275,29 @@ impl<'a> TableContext<'a> {
         let numeric_bounds = extract_numeric_bounds(schema_name, table, plan_index);
         let current_date_columns = extract_current_date_columns(table);
         let email_columns = extract_email_columns(table);
+        let column_rules: HashMap<&'a str, &'a ColumnRule> = table
+            .columns
+            .iter()
+            .filter_map(|column| {
+                plan_index
+                    .column_rule(schema_name, &table.name, &column.name)
+                    .map(|rule| (column.name.as_str(), rule))
+            })
+            .collect();
+        let transform_columns = extract_transform_columns(table, &column_rules);
+        let default_generators = table
+            .columns
+            .iter()
+            .map(|column| {
+                (
+                    column.name.as_str(),
+                    default_generator_id_for_column(column, &email_columns, enum_index),
+                )
+            })
+            .collect();
+        let fk_mode = plan_index.fk_mode(schema_name, &table.name);
+        let check_mode =
+            plan_index.constraint_mode(schema_name, &table.name, ConstraintKind::Check);
 
         let _ = schema; // reserved for future schema-aware extensions
 
@@ -272,9 +312,26 @@ impl<'a> TableContext<'a> {
             numeric_bounds,
             current_date_columns,
             email_columns,
+            transform_columns,
+            column_rules,
+            default_generators,
+            fk_mode,
+            check_mode,
             base_date,
         }
     }
+
+    /// Plan rule for a column of this table, resolved once at construction so
+    /// per-row lookups avoid rebuilding `schema.table.column` keys.
+    fn column_rule(&self, column: &str) -> Option<&'a ColumnRule> {
+        self.column_rules.get(column).copied()
+    }
+
+    /// Registry generator used when a column has no plan rule. Depends only on
+    /// the column's type, enum and name, so it is resolved once per table.
+    fn default_generator_id(&self, column: &str) -> Option<&'static str> {
+        self.default_generators.get(column).copied()
+    }
 }
 
 struct ColumnRule {
@@ -470,9 +527,17 @@ fn generate_table(
     report: &mut GenerationReport,
 ) -> Result<TableData, GenerationError> {
     let mut retries_total = 0;
+    let column_order = resolve_column_order(ctx)?;
+    // Every row has the same shape, so size the buffers up front instead of
+    // letting each row map and the output vector regrow as they fill. The
+    // output reservation is capped: `rows` comes from the plan, and an attempt
+    // may fail long before it is filled.
+    let row_capacity = ctx.table.columns.len();
+    let rows_capacity =
+        usize::try_from(rows).map_or(MAX_ROWS_PREALLOC, |rows| rows.min(MAX_ROWS_PREALLOC));
 
     for _ in 0..options.max_attempts_table {
-        let mut rows_out = Vec::new();
+        let mut rows_out = Vec::with_capacity(rows_capacity);
         let mut unique_sets = build_unique_sets(ctx);
         let mut failed = false;
 
@@ -482,10 +547,10 @@ fn generate_table(
                 row_attempts += 1;
                 let mut rng =
                     ChaCha8Rng::seed_from_u64(hash_row_seed(table_seed, row_index, row_attempts));
-                let mut row = HashMap::new();
+                let mut row = HashMap::with_capacity(row_capacity);
 
-                if plan_index.fk_mode(ctx.schema, &ctx.table.name) == ForeignKeyMode::Respect {
-                    apply_foreign_keys(ctx, plan_index, &mut row, &mut rng, table_data)?;
+                if ctx.fk_mode == ForeignKeyMode::Respect {
+                    apply_foreign_keys(ctx, &mut row, &mut rng, table_data)?;
                 } else if !plan_index.allow_fk_disable {
                     record_warning(
                         report,
@@ -505,26 +570,7 @@ fn generate_table(
                     );
                 }
 
-                let mut columns = ctx.table.columns.clone();
-                columns.sort_by_key(|col| col.ordinal_position);
-
-                let mut base_columns = Vec::new();
-                let mut derive_columns = Vec::new();
-                for column in columns {
-                    let rule = plan_index.column_rule(ctx.schema, &ctx.table.name, &column.name);
-                    if rule
-                        .map(|rule| is_derive_generator(&rule.generator_id))
-                        .unwrap_or(false)
-                    {
-                        derive_columns.push(column);
-                    } else {
-                        base_columns.push(column);
-                    }
-                }
-
-                let derive_order = resolve_derive_order(ctx, plan_index, &derive_columns)?;
-
-                for column in base_columns.iter().chain(derive_order.iter()) {
+                for column in &column_order {
                     let key = column.name.to_lowercase();
                     if row.contains_key(&key) {
                         continue;
@@ -562,7 +608,7 @@ fn generate_table(
                     continue;
                 }
 
-                if let Some(outcome) = evaluate_checks(ctx, plan_index, &row, report) {
+                if let Some(outcome) = evaluate_checks(ctx, &row, report) {
                     match outcome {
                         CheckOutcome::Passed => {}
                         CheckOutcome::Failed => {
@@ -626,7 +672,6 @@ fn generate_table(
 
 fn apply_foreign_keys(
     ctx: &TableContext<'_>,
-    plan_index: &PlanIndex,
     row: &mut HashMap<String, GeneratedValue>,
     rng: &mut ChaCha8Rng,
     table_data: &mut HashMap<String, TableData>,
@@ -635,11 +680,7 @@ fn apply_foreign_keys(
         let mut skip_fk = false;
         for child_col in &fk.columns {
             let child_key = child_col.to_lowercase();
-            if row.contains_key(&child_key)
-                || plan_index
-                    .column_rule(ctx.schema, &ctx.table.name, child_col)
-                    .is_some()
-            {
+            if row.contains_key(&child_key) || ctx.column_rule(child_col).is_some() {
                 skip_fk = true;
                 break;
             }
@@ -683,13 +724,39 @@ fn apply_foreign_keys(
     Ok(())
 }
 
+/// Resolve the per-row column evaluation order once per table: base columns
+/// by ordinal position, followed by derive columns in dependency order.
+fn resolve_column_order(
+    ctx: &TableContext<'_>,
+) -> Result<Vec<datalchemy_core::Column>, GenerationError> {
+    let mut columns = ctx.table.columns.clone();
+    columns.sort_by_key(|col| col.ordinal_position);
+
+    let mut base_columns = Vec::new();
+    let mut derive_columns = Vec::new();
+    for column in columns {
+        let rule = ctx.column_rule(&column.name);
+        if rule
+            .map(|rule| is_derive_generator(&rule.generator_id))
+            .unwrap_or(false)
+        {
+            derive_columns.push(column);
+        } else {
+            base_columns.push(column);
+        }
+    }
+
+    let derive_order = resolve_derive_order(ctx, &derive_columns)?;
+    base_columns.extend(derive_order);
+    Ok(base_columns)
+}
+
 fn is_derive_generator(generator_id: &str) -> bool {
     generator_id.starts_with("derive.")
 }
 
 fn resolve_derive_order(
     ctx: &TableContext<'_>,
-    plan_index: &PlanIndex,
     derive_columns: &[datalchemy_core::Column],
 ) -> Result<Vec<datalchemy_core::Column>, GenerationError> {
     if derive_columns.is_empty() {
@@ -716,8 +783,8 @@ fn resolve_derive_order(
 
     for column in derive_columns {
         let name = column.name.to_lowercase();
-        let inputs = plan_index
-            .column_rule(ctx.schema, &ctx.table.name, &column.name)
+        let inputs = ctx
+            .column_rule(&column.name)
             .map(|rule| rule.input_columns.as_slice())
             .unwrap_or(&[]);
 
@@ -797,7 +864,7 @@ fn generate_column_value(
     let key = column.name.to_lowercase();
     let unique_hint = ctx.unique_columns.contains(&key);
 
-    let rule = plan_index.column_rule(ctx.schema, &ctx.table.name, &column.name);
+    let rule = ctx.column_rule(&column.name);
     let mut value = if let Some(rule) = rule {
         if unique_hint && !is_derive_generator(&rule.generator_id) {
             generate_unique_from_rule(rule, column, row_index, ctx.base_date)
@@ -869,16 +936,10 @@ fn apply_row_transforms(
     rng: &mut ChaCha8Rng,
     report: &mut GenerationReport,
 ) -> Result<(), GenerationError> {
-    let mut columns = ctx.table.columns.clone();
-    columns.sort_by_key(|col| col.ordinal_position);
-
-    for column in &columns {
-        let Some(rule) = plan_index.column_rule(ctx.schema, &ctx.table.name, &column.name) else {
+    for column in &ctx.transform_columns {
+        let Some(rule) = ctx.column_rule(&column.name) else {
             continue;
         };
-        if rule.transforms.is_empty() {
-            continue;
-        }
 
         let key = column.name.to_lowercase();
         let value = match row.get(&key).cloned() {
@@ -1146,7 +1207,12 @@ fn generate_from_default_generator(
     rng: &mut ChaCha8Rng,
     locale: Option<&str>,
 ) -> Result<Option<(&'static str, GeneratedValue, &'static [&'static str])>, GenerationError> {
-    let generator_id = default_generator_id_for_column(ctx, column, enum_index);
+    let generator_id = ctx.default_generator_id(&column.name).ok_or_else(|| {
+        GenerationError::Unsupported(format!(
+            "column '{}.{}.{}' is not part of the table context",
+            ctx.schema, ctx.table.name, column.name
+        ))
+    })?;
     let Some(generator) = registry.generator(generator_id) else {
         return Ok(None);
     };
@@ -1167,14 +1233,14 @@ fn generate_from_default_generator(
 }
 
 fn default_generator_id_for_column(
-    ctx: &TableContext<'_>,
     column: &datalchemy_core::Column,
+    email_columns: &HashSet<String>,
     enum_index: &EnumIndex,
 ) -> &'static str {
     if enum_index.values_for(column).is_some() {
         return "primitive.enum";
     }
-    if ctx.email_columns.contains(&column.name.to_lowercase()) {
+    if email_columns.contains(&column.name.to_lowercase()) {
         return "semantic.person.email";
     }
     let data_type = normalize_type(&column.column_type).to_lowercase();
@@ -1415,12 +1481,11 @@ fn enforce_not_null(
 
 fn evaluate_checks(
     ctx: &TableContext<'_>,
-    plan_index: &PlanIndex,
     row: &HashMap<String, GeneratedValue>,
     report: &mut GenerationReport,
 ) -> Option<CheckOutcome> {
-    let mode = plan_index.constraint_mode(ctx.schema, &ctx.table.name, ConstraintKind::Check);
-    if mode == ConstraintMode::Ignore {
+    let mode = &ctx.check_mode;
+    if *mode == ConstraintMode::Ignore {
         return None;
     }
 
@@ -1433,7 +1498,7 @@ fn evaluate_checks(
         match evaluate_check(&check.expression, &check_ctx) {
             CheckOutcome::Passed => {}
             CheckOutcome::Failed => {
-                if mode == ConstraintMode::Warn {
+                if *mode == ConstraintMode::Warn {
                     record_warning(
                         report,
                         GenerationIssue {
@@ -1471,7 +1536,7 @@ fn evaluate_checks(
                         generator_id: None,
                     },
                 );
-                if mode == ConstraintMode::Enforce {
+                if *mode == ConstraintMode::Enforce {
                     outcome = CheckOutcome::Unsupported;
                 }
             }
@@ -1515,29 +1580,46 @@ impl UniqueSet {
         }
     }
 
+    /// Build the `|`-joined key for the set's columns directly into one
+    /// buffer, without allocating a string per column first.
     fn key_for(&self, row: &HashMap<String, GeneratedValue>) -> String {
-        let mut key_parts = Vec::new();
-        for column in &self.columns {
-            let value = row
-                .get(column)
-                .map(value_to_key)
-                .unwrap_or_else(|| "<null>".to_string());
-            key_parts.push(value);
+        let mut key = String::new();
+        for (idx, column) in self.columns.iter().enumerate() {
+            if idx > 0 {
+                key.push('|');
+            }
+            match row.get(column) {
+                Some(value) => push_value_key(&mut key, value),
+                None => key.push_str("<null>"),
+            }
         }
-        key_parts.join("|")
+        key
     }
 }
 
-fn value_to_key(value: &GeneratedValue) -> String {
+fn push_value_key(out: &mut String, value: &GeneratedValue) {
+    // Writing into a String cannot fail.
     match value {
-        GeneratedValue::Null => "<null>".to_string(),
-        GeneratedValue::Bool(value) => value.to_string(),
-        GeneratedValue::Int(value) => value.to_string(),
-        GeneratedValue::Float(value) => value.to_string(),
-        GeneratedValue::Text(value) | GeneratedValue::Uuid(value) => value.clone(),
-        GeneratedValue::Date(value) => value.format("%Y-%m-%d").to_string(),
-        GeneratedValue::Time(value) => value.format("%H:%M:%S").to_string(),
-        GeneratedValue::Timestamp(value) => value.format("%Y-%m-%dT%H:%M:%S").to_string(),
+        GeneratedValue::Null => out.push_str("<null>"),
+        GeneratedValue::Bool(value) => {
+            let _ = write!(out, "{value}");
+        }
+        GeneratedValue::Int(value) => {
+            let _ = write!(out, "{value}");
+        }
+        GeneratedValue::Float(value) => {
+            let _ = write!(out, "{value}");
+        }
+        GeneratedValue::Text(value) | GeneratedValue::Uuid(value) => out.push_str(value),
+        GeneratedValue::Date(value) => {
+            let _ = write!(out, "{}", value.format("%Y-%m-%d"));
+        }
+        GeneratedValue::Time(value) => {
+            let _ = write!(out, "{}", value.format("%H:%M:%S"));
+        }
+        GeneratedValue::Timestamp(value) => {
+            let _ = write!(out, "{}", value.format("%Y-%m-%dT%H:%M:%S"));
+        }
     }
 }
 
@@ -1689,6 +1771,26 @@ fn extract_current_date_columns(table: &Table) -> HashSet<String> {
     columns
 }
 
+/// Columns with plan transforms, in ordinal order, so row transforms only
+/// visit the columns that actually have work to do.
+fn extract_transform_columns<'a>(
+    table: &'a Table,
+    column_rules: &HashMap<&str, &ColumnRule>,
+) -> Vec<&'a datalchemy_core::Column> {
+    let mut columns: Vec<&datalchemy_core::Column> = table
+        .columns
+        .iter()
+        .filter(|column| {
+            column_rules
+                .get(column.name.as_str())
+                .map(|rule| !rule.transforms.is_empty())
+                .unwrap_or(false)
+        })
+        .collect();
+    columns.sort_by_key(|col| col.ordinal_position);
+    columns
+}
+
 fn extract_email_columns(table: &Table) -> HashSet<String> {
     let mut columns = HashSet::new();
     let re_position = regex::Regex::new(
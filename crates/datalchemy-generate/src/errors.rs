@@ -1,5 +1,6 @@
 use thiserror::Error;
 
+use crate::artifacts::JsonWriteError;
 use crate::model::GenerationReport;
 
 /// Errors emitted by the generation engine.
@@ -20,3 +21,12 @@ pub enum GenerationError {
     #[error("generation failed")]
     Failed(GenerationReport),
 }
+
+impl From<JsonWriteError> for GenerationError {
+    fn from(err: JsonWriteError) -> Self {
+        match err {
+            JsonWriteError::Io(err) => Self::Io(err),
+            JsonWriteError::Json(err) => Self::Json(err),
+        }
+    }
+}
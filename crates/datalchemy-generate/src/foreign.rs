@@ -23,9 +23,16 @@ pub trait ForeignContext {
 
 #[derive(Debug, Default)]
 pub struct InMemoryForeignContext {
-    column_values: BTreeMap<String, BTreeMap<String, Vec<GeneratedValue>>>,
+    column_values: BTreeMap<String, BTreeMap<String, ParentColumn>>,
     rows_by_pk: BTreeMap<String, BTreeMap<String, HashMap<String, GeneratedValue>>>,
-    cursor: BTreeMap<String, usize>,
+}
+
+/// Generated values of a parent column plus the round-robin position used by
+/// `pick_fk`, kept together so a pick needs a single map lookup.
+#[derive(Debug, Default)]
+struct ParentColumn {
+    values: Vec<GeneratedValue>,
+    cursor: usize,
 }
 
 impl InMemoryForeignContext {
@@ -42,14 +49,18 @@ impl InMemoryForeignContext {
         let table_key = table_key(schema, &table.name);
         let pk_column = primary_key_column(table);
 
-        let mut column_values: BTreeMap<String, Vec<GeneratedValue>> = BTreeMap::new();
+        let mut column_values: BTreeMap<String, ParentColumn> = BTreeMap::new();
         let mut row_map = BTreeMap::new();
 
         for row in rows {
             for column in &table.columns {
                 let key = column.name.to_lowercase();
                 if let Some(value) = row.get(&key) {
-                    column_values.entry(key).or_default().push(value.clone());
+                    column_values
+                        .entry(key)
+                        .or_default()
+                        .values
+                        .push(value.clone());
                 }
             }
 
@@ -79,26 +90,25 @@ impl ForeignContext for InMemoryForeignContext {
     ) -> Result<GeneratedValue, GenerationError> {
         let table_key = table_key(schema, table);
         let column_key = fk_column.to_lowercase();
-        let values = self
+        let column = self
             .column_values
-            .get(&table_key)
-            .and_then(|columns| columns.get(&column_key))
+            .get_mut(&table_key)
+            .and_then(|columns| columns.get_mut(&column_key))
             .ok_or_else(|| {
                 GenerationError::Unsupported(format!(
                     "no parent rows for fk {}.{}.{}",
                     schema, table, fk_column
                 ))
             })?;
-        if values.is_empty() {
+        let len = column.values.len();
+        if len == 0 {
             return Err(GenerationError::Unsupported(format!(
                 "no parent rows for fk {}.{}.{}",
                 schema, table, fk_column
             )));
         }
-        let cursor_key = format!("{table_key}.{column_key}");
-        let idx = self.cursor.entry(cursor_key).or_insert(0);
-        let value = values[*idx % values.len()].clone();
-        *idx = (*idx + 1) % values.len();
+        let value = column.values[column.cursor % len].clone();
+        column.cursor = (column.cursor + 1) % len;
         Ok(value)
     }
 
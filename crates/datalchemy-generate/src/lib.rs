@@ -9,6 +9,7 @@
 #![allow(clippy::too_many_arguments)]
 #![allow(clippy::type_complexity)]
 
+pub mod artifacts;
 pub mod assets;
 pub mod checks;
 pub mod engine;
@@ -102,11 +102,11 @@ impl GenerationReport {
     }
 
     pub fn record_generator_usage(&mut self, id: &str) {
-        *self.generator_usage.entry(id.to_string()).or_insert(0) += 1;
+        increment(&mut self.generator_usage, id);
     }
 
     pub fn record_transform_usage(&mut self, id: &str) {
-        *self.transform_usage.entry(id.to_string()).or_insert(0) += 1;
+        increment(&mut self.transform_usage, id);
     }
 
     pub fn record_fallback(&mut self) {
@@ -122,16 +122,26 @@ impl GenerationReport {
     }
 
     pub fn record_pii(&mut self, tag: &str) {
-        *self.pii_columns_touched.entry(tag.to_string()).or_insert(0) += 1;
+        increment(&mut self.pii_columns_touched, tag);
     }
 
     pub fn record_warning(&mut self, issue: GenerationIssue) {
-        *self.warnings_by_code.entry(issue.code.clone()).or_insert(0) += 1;
+        increment(&mut self.warnings_by_code, &issue.code);
         self.warnings.push(issue);
     }
 
     pub fn record_unsupported(&mut self, issue: GenerationIssue) {
-        *self.warnings_by_code.entry(issue.code.clone()).or_insert(0) += 1;
+        increment(&mut self.warnings_by_code, &issue.code);
         self.unsupported.push(issue);
     }
 }
+
+/// Bump a report counter, allocating the key only the first time it is seen.
+fn increment(counters: &mut BTreeMap<String, u64>, key: &str) {
+    match counters.get_mut(key) {
+        Some(count) => *count += 1,
+        None => {
+            counters.insert(key.to_string(), 1);
+        }
+    }
+}
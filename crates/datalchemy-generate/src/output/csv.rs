@@ -3,38 +3,42 @@ use std::fs::File;
 use std::io::{BufWriter, Write};
 use std::path::Path;
 
-use datalchemy_core::Table;
+use datalchemy_core::{Column, Table};
 
 use crate::generators::GeneratedValue;
 
+/// Buffer size for CSV output; large tables are flushed in big blocks.
+const CSV_BUFFER_BYTES: usize = 1 << 20;
+
 /// Write a table as CSV with deterministic column ordering.
 pub fn write_table_csv(
     path: &Path,
     table: &Table,
     rows: &[HashMap<String, GeneratedValue>],
 ) -> Result<u64, csv::Error> {
-    let writer = BufWriter::new(File::create(path).map_err(csv::Error::from)?);
+    let writer = BufWriter::with_capacity(
+        CSV_BUFFER_BYTES,
+        File::create(path).map_err(csv::Error::from)?,
+    );
     let counting = CountingWriter::new(writer);
     let mut writer = csv::WriterBuilder::new()
         .has_headers(false)
         .from_writer(counting);
 
-    let mut columns = table.columns.clone();
+    let mut columns: Vec<&Column> = table.columns.iter().collect();
     columns.sort_by_key(|col| col.ordinal_position);
+    let keys: Vec<String> = columns.iter().map(|col| col.name.to_lowercase()).collect();
 
-    let header: Vec<String> = columns.iter().map(|col| col.name.clone()).collect();
-    writer.write_record(&header)?;
+    writer.write_record(columns.iter().map(|col| col.name.as_str()))?;
 
     for row in rows {
-        let record: Vec<String> = columns
-            .iter()
-            .map(|col| {
-                row.get(&col.name.to_lowercase())
-                    .map(|value| value.to_csv(col))
-                    .unwrap_or_default()
-            })
-            .collect();
-        writer.write_record(&record)?;
+        for (col, key) in columns.iter().zip(&keys) {
+            match row.get(key) {
+                Some(value) => writer.write_field(value.to_csv(col))?,
+                None => writer.write_field("")?,
+            }
+        }
+        writer.write_record(None::<&[u8]>)?;
     }
 
     writer.flush()?;
@@ -1,4 +1,4 @@
-use std::collections::{BTreeSet, HashMap, VecDeque};
+use std::collections::{HashMap, VecDeque};
 
 use datalchemy_core::{Constraint, DatabaseSchema};
 use datalchemy_plan::Plan;
@@ -29,26 +29,9 @@ pub fn plan_tables(
             .or_insert(target.rows);
     }
 
-    let parents = build_parent_map(schema);
-
     if auto_generate_parents {
-        let mut queue: VecDeque<(String, u64)> = rows_by_table
-            .iter()
-            .map(|(key, rows)| (key.clone(), *rows))
-            .collect();
-        let mut visited: BTreeSet<String> = rows_by_table.keys().cloned().collect();
-
-        while let Some((child, child_rows)) = queue.pop_front() {
-            if let Some(parent_keys) = parents.get(&child) {
-                for parent in parent_keys {
-                    rows_by_table.entry(parent.clone()).or_insert(child_rows);
-                    if visited.insert(parent.clone()) {
-                        let rows = *rows_by_table.get(parent).unwrap_or(&child_rows);
-                        queue.push_back((parent.clone(), rows));
-                    }
-                }
-            }
-        }
+        let graph = ParentGraph::build(schema);
+        graph.inherit_parent_rows(&mut rows_by_table);
     }
 
     let order = datalchemy_core::build_fk_graph_report(schema)
@@ -76,27 +59,95 @@ pub fn plan_tables(
     Ok(tasks)
 }
 
-fn build_parent_map(schema: &DatabaseSchema) -> HashMap<String, BTreeSet<String>> {
-    let mut parents: HashMap<String, BTreeSet<String>> = HashMap::new();
-
-    for db_schema in &schema.schemas {
-        for table in &db_schema.tables {
-            let child_key = table_key(&db_schema.name, &table.name);
-            parents.entry(child_key.clone()).or_default();
-
-            for constraint in &table.constraints {
-                if let Constraint::ForeignKey(fk) = constraint {
-                    let parent_key = table_key(&fk.referenced_schema, &fk.referenced_table);
-                    parents
-                        .entry(child_key.clone())
-                        .or_default()
-                        .insert(parent_key);
+/// FK parent adjacency over dense table indices, so the transitive walk in
+/// [`ParentGraph::inherit_parent_rows`] touches plain vectors instead of
+/// hashing and cloning table keys per edge.
+struct ParentGraph {
+    keys: Vec<String>,
+    index: HashMap<String, usize>,
+    parents: Vec<Vec<usize>>,
+}
+
+impl ParentGraph {
+    fn build(schema: &DatabaseSchema) -> Self {
+        let mut graph = Self {
+            keys: Vec::new(),
+            index: HashMap::new(),
+            parents: Vec::new(),
+        };
+
+        // Intern every table before adding edges so indices follow schema
+        // order; FK targets outside the schema are appended after them.
+        for db_schema in &schema.schemas {
+            for table in &db_schema.tables {
+                graph.intern(table_key(&db_schema.name, &table.name));
+            }
+        }
+
+        for db_schema in &schema.schemas {
+            for table in &db_schema.tables {
+                let child = graph.intern(table_key(&db_schema.name, &table.name));
+                for constraint in &table.constraints {
+                    if let Constraint::ForeignKey(fk) = constraint {
+                        let parent =
+                            graph.intern(table_key(&fk.referenced_schema, &fk.referenced_table));
+                        graph.parents[child].push(parent);
+                    }
                 }
             }
         }
+
+        for parents in &mut graph.parents {
+            parents.sort_unstable();
+            parents.dedup();
+        }
+
+        graph
     }
 
-    parents
+    fn intern(&mut self, key: String) -> usize {
+        if let Some(&idx) = self.index.get(&key) {
+            return idx;
+        }
+        let idx = self.keys.len();
+        self.index.insert(key.clone(), idx);
+        self.keys.push(key);
+        self.parents.push(Vec::new());
+        idx
+    }
+
+    /// Add every transitive parent of the requested tables, inheriting the
+    /// row count of the first child that reaches it. Seeds are walked in
+    /// schema order so the result does not depend on hash iteration order.
+    fn inherit_parent_rows(&self, rows_by_table: &mut HashMap<String, u64>) {
+        let mut rows: Vec<Option<u64>> = vec![None; self.keys.len()];
+        let mut queue: VecDeque<usize> = VecDeque::new();
+
+        for (idx, key) in self.keys.iter().enumerate() {
+            if let Some(&seed_rows) = rows_by_table.get(key) {
+                rows[idx] = Some(seed_rows);
+                queue.push_back(idx);
+            }
+        }
+
+        while let Some(child) = queue.pop_front() {
+            let Some(child_rows) = rows[child] else {
+                continue;
+            };
+            for &parent in &self.parents[child] {
+                if rows[parent].is_none() {
+                    rows[parent] = Some(child_rows);
+                    queue.push_back(parent);
+                }
+            }
+        }
+
+        for (key, table_rows) in self.keys.iter().zip(rows) {
+            if let Some(table_rows) = table_rows {
+                rows_by_table.entry(key.clone()).or_insert(table_rows);
+            }
+        }
+    }
 }
 
 fn table_key(schema: &str, table: &str) -> String {
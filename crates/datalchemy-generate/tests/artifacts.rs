@@ -0,0 +1,52 @@
+use std::collections::BTreeMap;
+use std::fs;
+use std::path::PathBuf;
+
+use datalchemy_generate::GenerationError;
+use datalchemy_generate::artifacts::write_json_pretty;
+
+fn temp_dir(label: &str) -> PathBuf {
+    let dir = std::env::temp_dir().join(format!(
+        "datalchemy_artifacts_{label}_{}",
+        std::process::id()
+    ));
+    fs::create_dir_all(&dir).expect("create temp dir");
+    dir
+}
+
+#[test]
+fn serialization_failure_maps_to_json_error() {
+    let dir = temp_dir("json");
+    // JSON object keys must be strings; tuple keys fail during serialization.
+    let mut value = BTreeMap::new();
+    value.insert((1, 2), "x");
+
+    let err = write_json_pretty(&dir.join("report.json"), &value).expect_err("must fail");
+    assert!(matches!(
+        GenerationError::from(err),
+        GenerationError::Json(_)
+    ));
+}
+
+#[test]
+fn filesystem_failure_maps_to_io_error() {
+    let dir = temp_dir("io");
+    let path = dir.join("missing").join("report.json");
+
+    let err = write_json_pretty(&path, &vec![1, 2, 3]).expect_err("must fail");
+    assert!(matches!(GenerationError::from(err), GenerationError::Io(_)));
+}
+
+#[test]
+fn writes_pretty_json() {
+    let dir = temp_dir("ok");
+    let path = dir.join("report.json");
+    let value = serde_json::json!({ "rows": 3 });
+
+    write_json_pretty(&path, &value).expect("write artifact");
+    let written = fs::read_to_string(&path).expect("read artifact");
+    assert_eq!(
+        written,
+        serde_json::to_string_pretty(&value).expect("serialize")
+    );
+}
@@ -0,0 +1,98 @@
+use datalchemy_core::DatabaseSchema;
+use datalchemy_generate::planner::plan_tables;
+use datalchemy_plan::Plan;
+use serde_json::{Value, json};
+
+fn table(name: &str, parents: &[&str]) -> Value {
+    let foreign_keys: Vec<Value> = parents
+        .iter()
+        .map(|parent| {
+            json!({
+                "kind": "foreign_key",
+                "name": format!("{name}_{parent}_fkey"),
+                "columns": [format!("{parent}_id")],
+                "referenced_schema": "app",
+                "referenced_table": parent,
+                "referenced_columns": ["id"],
+                "on_update": "no_action",
+                "on_delete": "no_action",
+                "match_type": "simple",
+                "is_deferrable": false,
+                "initially_deferred": false
+            })
+        })
+        .collect();
+
+    json!({
+        "name": name,
+        "kind": "table",
+        "comment": null,
+        "columns": [],
+        "constraints": foreign_keys,
+        "indexes": []
+    })
+}
+
+fn schema(tables: Vec<Value>) -> DatabaseSchema {
+    serde_json::from_value(json!({
+        "schema_version": "0.2",
+        "engine": "postgres",
+        "database": null,
+        "schemas": [{ "name": "app", "tables": tables }],
+        "enums": [],
+        "schema_fingerprint": null
+    }))
+    .expect("parse schema")
+}
+
+fn plan(targets: &[(&str, u64)]) -> Plan {
+    let targets: Vec<Value> = targets
+        .iter()
+        .map(|(table, rows)| json!({ "schema": "app", "table": table, "rows": rows }))
+        .collect();
+    serde_json::from_value(json!({
+        "plan_version": "0.2",
+        "seed": 1,
+        "schema_ref": { "schema_version": "0.2", "engine": "postgres" },
+        "targets": targets,
+        "rules": []
+    }))
+    .expect("parse plan")
+}
+
+fn rows_for(schema: &DatabaseSchema, plan: &Plan, table: &str) -> Option<u64> {
+    plan_tables(schema, plan, true)
+        .expect("plan tables")
+        .into_iter()
+        .find(|task| task.table == table)
+        .map(|task| task.rows)
+}
+
+#[test]
+fn shared_parent_inherits_rows_from_first_child_in_schema_order() {
+    // `c` references `b` before `a` or `b` are seen as children, so interning
+    // parents on first reference would have put `b` ahead of `a`.
+    let schema = schema(vec![
+        table("c", &["b"]),
+        table("a", &["p"]),
+        table("b", &["p"]),
+        table("p", &[]),
+    ]);
+    let plan = plan(&[("a", 10), ("b", 20)]);
+
+    for _ in 0..8 {
+        assert_eq!(rows_for(&schema, &plan, "p"), Some(10));
+    }
+    assert_eq!(rows_for(&schema, &plan, "a"), Some(10));
+    assert_eq!(rows_for(&schema, &plan, "b"), Some(20));
+    assert_eq!(rows_for(&schema, &plan, "c"), None);
+}
+
+#[test]
+fn explicit_target_rows_win_over_inherited_rows() {
+    let schema = schema(vec![table("child", &["parent"]), table("parent", &[])]);
+    let plan = plan(&[("child", 50), ("parent", 5)]);
+
+    assert_eq!(rows_for(&schema, &plan, "parent"), Some(5));
+    assert_eq!(rows_for(&schema, &plan, "child"), Some(50));
+}
@@ -48,9 +48,13 @@ pub async fn introspect_postgres_with_options(
 
 /// Introspect a Postgres database according to the provided options.
 pub async fn introspect(pool: &PgPool, opts: &IntrospectOptions) -> Result<DatabaseSchema> {
-    let database = queries::fetch_database_name(pool).await?;
-    let schemas = mapper::filter_schemas(queries::list_schemas(pool).await?, opts);
-    let mut enums = mapper::map_enums(queries::list_enums(pool).await?, opts);
+    let (database, raw_schemas, raw_enums) = tokio::try_join!(
+        queries::fetch_database_name(pool),
+        queries::list_schemas(pool),
+        queries::list_enums(pool),
+    )?;
+    let schemas = mapper::filter_schemas(raw_schemas, opts);
+    let mut enums = mapper::map_enums(raw_enums, opts);
 
     let mut schema_items = Vec::new();
 
@@ -59,41 +63,50 @@ pub async fn introspect(pool: &PgPool, opts: &IntrospectOptions) -> Result<Datab
         let mut tables = mapper::map_tables(raw_tables, opts);
 
         for table in &mut tables {
-            let raw_columns = queries::list_columns(pool, &schema_name, &table.name).await?;
-            table.columns = mapper::map_columns(raw_columns, opts);
-
-            let raw_pk = queries::get_primary_key(pool, &schema_name, &table.name).await?;
-            let raw_uniques =
-                queries::list_unique_constraints(pool, &schema_name, &table.name).await?;
-            let raw_checks =
-                queries::list_check_constraints(pool, &schema_name, &table.name).await?;
-            let raw_fks = queries::list_foreign_keys(pool, &schema_name, &table.name).await?;
+            // The catalog queries for a table are independent, so issue them
+            // concurrently; the pool serves each one on its own connection.
+            let (columns, pk, uniques, checks, fks, indexes) = tokio::try_join!(
+                queries::list_columns(pool, &schema_name, &table.name),
+                queries::get_primary_key(pool, &schema_name, &table.name),
+                queries::list_unique_constraints(pool, &schema_name, &table.name),
+                queries::list_check_constraints(pool, &schema_name, &table.name),
+                queries::list_foreign_keys(pool, &schema_name, &table.name),
+                async {
+                    if opts.include_indexes {
+                        queries::list_indexes(pool, &schema_name, &table.name)
+                            .await
+                            .map(Some)
+                    } else {
+                        Ok(None)
+                    }
+                },
+            )?;
+            table.columns = mapper::map_columns(columns, opts);
 
             let mut constraints = Vec::new();
-            if let Some(pk) = mapper::map_primary_key(raw_pk) {
+            if let Some(pk) = mapper::map_primary_key(pk) {
                 constraints.push(datalchemy_core::Constraint::PrimaryKey(pk));
             }
             constraints.extend(
-                mapper::map_unique_constraints(raw_uniques)
+                mapper::map_unique_constraints(uniques)
                     .into_iter()
                     .map(datalchemy_core::Constraint::Unique),
             );
             constraints.extend(
-                mapper::map_check_constraints(raw_checks)
+                mapper::map_check_constraints(checks)
                     .into_iter()
                     .map(datalchemy_core::Constraint::Check),
             );
             constraints.extend(
-                mapper::map_foreign_keys(raw_fks)
+                mapper::map_foreign_keys(fks)
                     .into_iter()
                     .map(datalchemy_core::Constraint::ForeignKey),
             );
             mapper::sort_constraints(&mut constraints);
             table.constraints = constraints;
 
-            if opts.include_indexes {
-                let raw_indexes = queries::list_indexes(pool, &schema_name, &table.name).await?;
-                table.indexes = mapper::map_indexes(raw_indexes);
+            if let Some(indexes) = indexes {
+                table.indexes = mapper::map_indexes(indexes);
             }
         }
 
@@ -2,8 +2,6 @@
 
 use std::collections::BTreeMap;
 
-use sqlx::SqlitePool;
-
 use datalchemy_core::types::ColumnType;
 use datalchemy_core::{
     CheckConstraint, Column, Constraint, FkAction, FkMatchType, ForeignKey, Index, PrimaryKey,
@@ -137,8 +135,13 @@ fn map_fk_match(raw: &str) -> FkMatchType {
     }
 }
 
-/// Map raw indexes to [`Index`] values, fetching column details.
-pub async fn map_indexes(raw: Vec<RawIndex>, pool: &SqlitePool, table: &str) -> Vec<Index> {
+/// Map raw indexes to [`Index`] values, taking key columns from the batched
+/// `index_columns` lookup.
+pub fn map_indexes(
+    raw: Vec<RawIndex>,
+    index_columns: &mut BTreeMap<String, Vec<String>>,
+    table: &str,
+) -> Vec<Index> {
     let mut indexes = Vec::new();
     for idx in raw {
         // Skip auto-created indexes for PRIMARY KEY / UNIQUE constraints
@@ -146,15 +149,17 @@ pub async fn map_indexes(raw: Vec<RawIndex>, pool: &SqlitePool, table: &str) ->
             continue;
         }
 
-        let cols = super::queries::list_index_columns(pool, &idx.name)
-            .await
-            .unwrap_or_default();
-        let col_list = cols.join(", ");
+        let cols = index_columns.remove(&idx.name).unwrap_or_default();
+        let col_list = cols
+            .iter()
+            .map(|col| column_ident(col))
+            .collect::<Vec<_>>()
+            .join(", ");
         let definition = format!(
-            "CREATE{}INDEX \"{}\" ON \"{}\" ({})",
+            "CREATE{}INDEX {} ON {} ({})",
             if idx.unique { " UNIQUE " } else { " " },
-            idx.name,
-            table,
+            quote_ident(&idx.name),
+            quote_ident(table),
             col_list
         );
 
@@ -169,3 +174,23 @@ pub async fn map_indexes(raw: Vec<RawIndex>, pool: &SqlitePool, table: &str) ->
     }
     indexes
 }
+
+/// Quote an identifier for SQL, doubling embedded double quotes.
+fn quote_ident(name: &str) -> String {
+    format!("\"{}\"", name.replace('"', "\"\""))
+}
+
+/// Render a column name in an index definition, quoting it only when it is
+/// not a plain identifier so ordinary definitions keep their existing form.
+fn column_ident(name: &str) -> String {
+    let mut chars = name.chars();
+    let plain = chars
+        .next()
+        .is_some_and(|first| first.is_ascii_alphabetic() || first == '_')
+        && chars.all(|ch| ch.is_ascii_alphanumeric() || ch == '_');
+    if plain {
+        name.to_string()
+    } else {
+        quote_ident(name)
+    }
+}
@@ -3,6 +3,8 @@
 mod mapper;
 mod queries;
 
+use std::collections::BTreeMap;
+
 use sqlx::SqlitePool;
 
 use datalchemy_core::{DatabaseSchema, Result, SCHEMA_VERSION, Schema};
@@ -50,13 +52,22 @@ pub async fn introspect_sqlite_with_options(
 /// Introspect a SQLite database according to the provided options.
 async fn introspect(pool: &SqlitePool, opts: &IntrospectOptions) -> Result<DatabaseSchema> {
     let table_names = queries::list_tables(pool).await?;
+    let mut all_columns = queries::list_all_columns(pool).await?;
+    let mut all_fks = queries::list_all_foreign_keys(pool).await?;
+    let (mut all_indexes, mut index_columns) = if opts.include_indexes {
+        (
+            queries::list_all_indexes(pool).await?,
+            queries::list_all_index_columns(pool).await?,
+        )
+    } else {
+        (BTreeMap::new(), BTreeMap::new())
+    };
 
     let mut tables = Vec::new();
 
     for table_name in table_names {
-        let raw_columns = queries::list_columns(pool, &table_name).await?;
-        let raw_fks = queries::list_foreign_keys(pool, &table_name).await?;
-        let raw_indexes = queries::list_indexes(pool, &table_name).await?;
+        let raw_columns = all_columns.remove(&table_name).unwrap_or_default();
+        let raw_fks = all_fks.remove(&table_name).unwrap_or_default();
 
         let mut table = mapper::map_table(&table_name, raw_columns);
         table.constraints.extend(
@@ -65,8 +76,8 @@ async fn introspect(pool: &SqlitePool, opts: &IntrospectOptions) -> Result<Datab
                 .map(datalchemy_core::Constraint::ForeignKey),
         );
 
-        if opts.include_indexes {
-            table.indexes = mapper::map_indexes(raw_indexes, pool, &table_name).await;
+        if let Some(raw_indexes) = all_indexes.remove(&table_name) {
+            table.indexes = mapper::map_indexes(raw_indexes, &mut index_columns, &table_name);
         }
 
         tables.push(table);
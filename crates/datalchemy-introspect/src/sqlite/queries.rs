@@ -1,4 +1,10 @@
 //! SQLite catalog queries using PRAGMA statements.
+//!
+//! Per-table PRAGMAs are read through their table-valued forms joined against
+//! `sqlite_master`, so each kind of metadata costs one query for the whole
+//! database rather than one per table.
+
+use std::collections::BTreeMap;
 
 use sqlx::{Row, SqlitePool};
 
@@ -57,14 +63,27 @@ pub async fn list_tables(pool: &SqlitePool) -> Result<Vec<String>> {
     Ok(names)
 }
 
-/// List columns for a table via `PRAGMA table_info`.
-pub async fn list_columns(pool: &SqlitePool, table: &str) -> Result<Vec<RawColumn>> {
-    let query = format!("PRAGMA table_info(\"{}\")", table);
-    let rows = sqlx::query(&query).fetch_all(pool).await.map_err(db_err)?;
+/// List columns for every user table in one query via `pragma_table_info`.
+///
+/// Rows are grouped by table name, each group in `cid` order.
+pub async fn list_all_columns(pool: &SqlitePool) -> Result<BTreeMap<String, Vec<RawColumn>>> {
+    let rows = sqlx::query(
+        "SELECT m.name AS table_name, p.cid, p.name, p.\"type\", p.\"notnull\",
+                p.dflt_value, p.pk
+         FROM sqlite_master AS m
+         JOIN pragma_table_info(m.name) AS p
+         WHERE m.type = 'table'
+         AND m.name NOT LIKE 'sqlite_%'
+         ORDER BY m.name, p.cid",
+    )
+    .fetch_all(pool)
+    .await
+    .map_err(db_err)?;
 
-    let mut columns = Vec::new();
+    let mut columns: BTreeMap<String, Vec<RawColumn>> = BTreeMap::new();
     for row in rows {
-        columns.push(RawColumn {
+        let table = row.try_get::<String, _>("table_name").map_err(db_err)?;
+        columns.entry(table).or_default().push(RawColumn {
             cid: row.try_get::<i64, _>("cid").map_err(db_err)?,
             name: row.try_get::<String, _>("name").map_err(db_err)?,
             col_type: row.try_get::<String, _>("type").map_err(db_err)?,
@@ -78,14 +97,28 @@ pub async fn list_columns(pool: &SqlitePool, table: &str) -> Result<Vec<RawColum
     Ok(columns)
 }
 
-/// List foreign keys for a table via `PRAGMA foreign_key_list`.
-pub async fn list_foreign_keys(pool: &SqlitePool, table: &str) -> Result<Vec<RawForeignKey>> {
-    let query = format!("PRAGMA foreign_key_list(\"{}\")", table);
-    let rows = sqlx::query(&query).fetch_all(pool).await.map_err(db_err)?;
+/// List foreign keys for every user table in one query via
+/// `pragma_foreign_key_list`, grouped by table name.
+pub async fn list_all_foreign_keys(
+    pool: &SqlitePool,
+) -> Result<BTreeMap<String, Vec<RawForeignKey>>> {
+    let rows = sqlx::query(
+        "SELECT m.name AS table_name, p.id, p.seq, p.\"table\", p.\"from\", p.\"to\",
+                p.on_update, p.on_delete, p.\"match\"
+         FROM sqlite_master AS m
+         JOIN pragma_foreign_key_list(m.name) AS p
+         WHERE m.type = 'table'
+         AND m.name NOT LIKE 'sqlite_%'
+         ORDER BY m.name, p.id, p.seq",
+    )
+    .fetch_all(pool)
+    .await
+    .map_err(db_err)?;
 
-    let mut fks = Vec::new();
+    let mut fks: BTreeMap<String, Vec<RawForeignKey>> = BTreeMap::new();
     for row in rows {
-        fks.push(RawForeignKey {
+        let table = row.try_get::<String, _>("table_name").map_err(db_err)?;
+        fks.entry(table).or_default().push(RawForeignKey {
             id: row.try_get::<i64, _>("id").map_err(db_err)?,
             seq: row.try_get::<i64, _>("seq").map_err(db_err)?,
             table: row.try_get::<String, _>("table").map_err(db_err)?,
@@ -99,14 +132,25 @@ pub async fn list_foreign_keys(pool: &SqlitePool, table: &str) -> Result<Vec<Raw
     Ok(fks)
 }
 
-/// List indexes for a table via `PRAGMA index_list`.
-pub async fn list_indexes(pool: &SqlitePool, table: &str) -> Result<Vec<RawIndex>> {
-    let query = format!("PRAGMA index_list(\"{}\")", table);
-    let rows = sqlx::query(&query).fetch_all(pool).await.map_err(db_err)?;
+/// List indexes for every user table in one query via `pragma_index_list`,
+/// grouped by table name in `PRAGMA index_list` order.
+pub async fn list_all_indexes(pool: &SqlitePool) -> Result<BTreeMap<String, Vec<RawIndex>>> {
+    let rows = sqlx::query(
+        "SELECT m.name AS table_name, p.name, p.\"unique\", p.origin
+         FROM sqlite_master AS m
+         JOIN pragma_index_list(m.name) AS p
+         WHERE m.type = 'table'
+         AND m.name NOT LIKE 'sqlite_%'
+         ORDER BY m.name, p.seq",
+    )
+    .fetch_all(pool)
+    .await
+    .map_err(db_err)?;
 
-    let mut indexes = Vec::new();
+    let mut indexes: BTreeMap<String, Vec<RawIndex>> = BTreeMap::new();
     for row in rows {
-        indexes.push(RawIndex {
+        let table = row.try_get::<String, _>("table_name").map_err(db_err)?;
+        indexes.entry(table).or_default().push(RawIndex {
             name: row.try_get::<String, _>("name").map_err(db_err)?,
             unique: row.try_get::<bool, _>("unique").map_err(db_err)?,
             origin: row.try_get::<String, _>("origin").map_err(db_err)?,
@@ -115,15 +159,41 @@ pub async fn list_indexes(pool: &SqlitePool, table: &str) -> Result<Vec<RawIndex
     Ok(indexes)
 }
 
-/// List columns of an index via `PRAGMA index_info`.
-pub async fn list_index_columns(pool: &SqlitePool, index_name: &str) -> Result<Vec<String>> {
-    let query = format!("PRAGMA index_info(\"{}\")", index_name);
-    let rows = sqlx::query(&query).fetch_all(pool).await.map_err(db_err)?;
+/// List the key columns of every index in one query via `pragma_index_info`,
+/// keyed by index name (unique per database) in `seqno` order.
+///
+/// An index with an expression key yields no columns, as `PRAGMA index_info`
+/// reports no name for that key.
+pub async fn list_all_index_columns(pool: &SqlitePool) -> Result<BTreeMap<String, Vec<String>>> {
+    let rows = sqlx::query(
+        "SELECT il.name AS index_name, ii.name
+         FROM sqlite_master AS m
+         JOIN pragma_index_list(m.name) AS il
+         JOIN pragma_index_info(il.name) AS ii
+         WHERE m.type = 'table'
+         AND m.name NOT LIKE 'sqlite_%'
+         ORDER BY m.name, il.seq, ii.seqno",
+    )
+    .fetch_all(pool)
+    .await
+    .map_err(db_err)?;
 
-    let mut cols = Vec::new();
+    let mut columns: BTreeMap<String, Option<Vec<String>>> = BTreeMap::new();
     for row in rows {
-        let name: String = row.try_get("name").map_err(db_err)?;
-        cols.push(name);
+        let index = row.try_get::<String, _>("index_name").map_err(db_err)?;
+        let name = row.try_get::<Option<String>, _>("name").map_err(db_err)?;
+        let entry = columns.entry(index).or_insert_with(|| Some(Vec::new()));
+        match name {
+            Some(name) => {
+                if let Some(cols) = entry.as_mut() {
+                    cols.push(name);
+                }
+            }
+            None => *entry = None,
+        }
     }
-    Ok(cols)
+    Ok(columns
+        .into_iter()
+        .map(|(index, cols)| (index, cols.unwrap_or_default()))
+        .collect())
 }
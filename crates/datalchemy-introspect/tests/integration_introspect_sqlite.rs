@@ -0,0 +1,204 @@
+use anyhow::{Context, Result, anyhow};
+use datalchemy_core::{Constraint, FkAction, ForeignKey, Table};
+use datalchemy_introspect::{IntrospectOptions, introspect_sqlite_with_options};
+use sqlx::{Row, SqlitePool, sqlite::SqlitePoolOptions};
+
+const FIXTURE: &str = r#"
+CREATE TABLE "order items" (
+    id INTEGER PRIMARY KEY,
+    "my ""col""" TEXT
+);
+CREATE TABLE parent (
+    a INTEGER NOT NULL,
+    b TEXT NOT NULL,
+    label TEXT DEFAULT 'x',
+    PRIMARY KEY (a, b)
+);
+CREATE TABLE child (
+    id INTEGER PRIMARY KEY,
+    pa INTEGER,
+    pb TEXT,
+    oi INTEGER REFERENCES "order items" (id) ON DELETE CASCADE,
+    note TEXT UNIQUE,
+    FOREIGN KEY (pa, pb) REFERENCES parent (a, b) ON UPDATE CASCADE
+);
+CREATE INDEX idx_child_pair ON child (pb, pa);
+CREATE UNIQUE INDEX idx_child_oi ON child (oi);
+CREATE INDEX idx_child_note_pa ON child (note, pa);
+CREATE INDEX "idx ""quoted""" ON "order items" ("my ""col""")
+"#;
+
+async fn memory_pool() -> Result<SqlitePool> {
+    // A single connection: every `sqlite::memory:` connection is its own database.
+    let pool = SqlitePoolOptions::new()
+        .max_connections(1)
+        .connect("sqlite::memory:")
+        .await
+        .context("opening in-memory SQLite")?;
+
+    for statement in FIXTURE.split(';') {
+        let sql = statement.trim();
+        if sql.is_empty() {
+            continue;
+        }
+        sqlx::query(sql)
+            .execute(&pool)
+            .await
+            .with_context(|| format!("executing fixture statement: {sql}"))?;
+    }
+
+    Ok(pool)
+}
+
+fn quote_ident(name: &str) -> String {
+    format!("\"{}\"", name.replace('"', "\"\""))
+}
+
+/// Column names as reported by a per-table `PRAGMA table_info`.
+async fn pragma_columns(pool: &SqlitePool, table: &str) -> Result<Vec<String>> {
+    let sql = format!("PRAGMA table_info({})", quote_ident(table));
+    let rows = sqlx::query(&sql).fetch_all(pool).await?;
+    Ok(rows
+        .iter()
+        .map(|row| row.try_get::<String, _>("name"))
+        .collect::<std::result::Result<_, _>>()?)
+}
+
+/// FK source columns grouped by `id` as reported by `PRAGMA foreign_key_list`.
+async fn pragma_fk_columns(pool: &SqlitePool, table: &str) -> Result<Vec<Vec<String>>> {
+    let sql = format!("PRAGMA foreign_key_list({})", quote_ident(table));
+    let rows = sqlx::query(&sql).fetch_all(pool).await?;
+    let mut grouped: std::collections::BTreeMap<i64, Vec<(i64, String)>> = Default::default();
+    for row in rows {
+        grouped
+            .entry(row.try_get("id")?)
+            .or_default()
+            .push((row.try_get("seq")?, row.try_get("from")?));
+    }
+    Ok(grouped
+        .into_values()
+        .map(|mut parts| {
+            parts.sort();
+            parts.into_iter().map(|(_, from)| from).collect()
+        })
+        .collect())
+}
+
+/// Explicitly created index names in `PRAGMA index_list` order.
+async fn pragma_index_names(pool: &SqlitePool, table: &str) -> Result<Vec<String>> {
+    let sql = format!("PRAGMA index_list({})", quote_ident(table));
+    let rows = sqlx::query(&sql).fetch_all(pool).await?;
+    let mut names = Vec::new();
+    for row in rows {
+        let origin: String = row.try_get("origin")?;
+        if origin == "c" {
+            names.push(row.try_get("name")?);
+        }
+    }
+    Ok(names)
+}
+
+fn foreign_keys(table: &Table) -> Vec<&ForeignKey> {
+    table
+        .constraints
+        .iter()
+        .filter_map(|constraint| match constraint {
+            Constraint::ForeignKey(fk) => Some(fk),
+            _ => None,
+        })
+        .collect()
+}
+
+#[tokio::test]
+async fn introspects_sqlite_in_per_table_pragma_order() -> Result<()> {
+    let pool = memory_pool().await?;
+    let snapshot = introspect_sqlite_with_options(&pool, IntrospectOptions::default()).await?;
+
+    assert_eq!(snapshot.engine, "sqlite");
+    let main = snapshot
+        .schemas
+        .first()
+        .ok_or_else(|| anyhow!("expected 'main' schema"))?;
+    let table_names: Vec<&str> = main.tables.iter().map(|t| t.name.as_str()).collect();
+    assert_eq!(table_names, vec!["child", "order items", "parent"]);
+
+    for table in &main.tables {
+        let columns: Vec<String> = table.columns.iter().map(|c| c.name.clone()).collect();
+        assert_eq!(columns, pragma_columns(&pool, &table.name).await?);
+
+        let fk_columns: Vec<Vec<String>> = foreign_keys(table)
+            .iter()
+            .map(|fk| fk.columns.clone())
+            .collect();
+        assert_eq!(fk_columns, pragma_fk_columns(&pool, &table.name).await?);
+
+        let indexes: Vec<String> = table.indexes.iter().map(|i| i.name.clone()).collect();
+        assert_eq!(indexes, pragma_index_names(&pool, &table.name).await?);
+    }
+
+    let child = &main.tables[0];
+    let child_columns: Vec<&str> = child.columns.iter().map(|c| c.name.as_str()).collect();
+    assert_eq!(child_columns, vec!["id", "pa", "pb", "oi", "note"]);
+
+    let child_fks = foreign_keys(child);
+    assert_eq!(child_fks.len(), 2);
+    assert_eq!(child_fks[0].referenced_table, "parent");
+    assert_eq!(child_fks[0].columns, vec!["pa", "pb"]);
+    assert_eq!(child_fks[0].referenced_columns, vec!["a", "b"]);
+    assert_eq!(child_fks[0].on_update, FkAction::Cascade);
+    assert_eq!(child_fks[1].referenced_table, "order items");
+    assert_eq!(child_fks[1].columns, vec!["oi"]);
+    assert_eq!(child_fks[1].on_delete, FkAction::Cascade);
+
+    let child_indexes: Vec<(&str, bool, &str)> = child
+        .indexes
+        .iter()
+        .map(|i| (i.name.as_str(), i.is_unique, i.definition.as_str()))
+        .collect();
+    assert_eq!(
+        child_indexes,
+        vec![
+            (
+                "idx_child_note_pa",
+                false,
+                "CREATE INDEX \"idx_child_note_pa\" ON \"child\" (note, pa)"
+            ),
+            (
+                "idx_child_oi",
+                true,
+                "CREATE UNIQUE INDEX \"idx_child_oi\" ON \"child\" (oi)"
+            ),
+            (
+                "idx_child_pair",
+                false,
+                "CREATE INDEX \"idx_child_pair\" ON \"child\" (pb, pa)"
+            ),
+        ]
+    );
+
+    let order_items = &main.tables[1];
+    let quoted_index = order_items
+        .indexes
+        .first()
+        .ok_or_else(|| anyhow!("expected index on \"order items\""))?;
+    assert_eq!(quoted_index.name, "idx \"quoted\"");
+    assert_eq!(
+        quoted_index.definition,
+        r#"CREATE INDEX "idx ""quoted""" ON "order items" ("my ""col""")"#
+    );
+
+    let parent = &main.tables[2];
+    let parent_pk = parent
+        .constraints
+        .iter()
+        .find_map(|constraint| match constraint {
+            Constraint::PrimaryKey(pk) => Some(pk.columns.clone()),
+            _ => None,
+        })
+        .ok_or_else(|| anyhow!("parent primary key missing"))?;
+    assert_eq!(parent_pk, vec!["a", "b"]);
+    assert!(parent.indexes.is_empty(), "pk auto-index must be skipped");
+
+    pool.close().await;
+    Ok(())
+}
@@ -17,7 +17,8 @@ pub use model::{
 };
 pub use schema::plan_json_schema;
 pub use validate::{
-    ValidatedPlan, validate_plan, validate_plan_against_schema, validate_plan_json,
+    ValidatedPlan, validate_bundled_plan, validate_bundled_plan_json, validate_plan,
+    validate_plan_against_schema, validate_plan_json,
 };
 
 /// Current plan contract version for `plan.json` artifacts.
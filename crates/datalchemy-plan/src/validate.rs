@@ -1,4 +1,5 @@
 use std::collections::{HashMap, HashSet};
+use std::sync::OnceLock;
 
 use datalchemy_core::{Constraint, DatabaseSchema};
 use jsonschema::JSONSchema;
@@ -9,6 +10,7 @@ use crate::model::{
     ConstraintKind, ConstraintMode, ConstraintPolicyRule, ForeignKeyMode, ForeignKeyStrategyRule,
     Plan, Rule, Target, UnsupportedRule,
 };
+use crate::schema::plan_json_schema;
 
 /// Validated plan with accumulated warnings.
 #[derive(Debug, Clone)]
@@ -25,22 +27,18 @@ pub fn validate_plan_json(
     let compiled =
         JSONSchema::compile(plan_schema).map_err(|err| PlanError::Schema(err.to_string()))?;
 
-    let mut report = ValidationReport::default();
-
-    if let Err(errors) = compiled.validate(plan_json) {
-        for error in errors {
-            let path = normalized_json_pointer(&error.instance_path.to_string());
-            report.push_error(ValidationIssue::new(
-                IssueSeverity::Error,
-                "schema_violation",
-                path,
-                error.to_string(),
-                None,
-            ));
-        }
-    }
+    Ok(collect_schema_violations(&compiled, plan_json))
+}
 
-    Ok(report)
+/// Validate a plan JSON document against the bundled `plan.json` JSON Schema.
+///
+/// The bundled schema is generated and compiled once per process, so repeated
+/// calls skip the compile step that [`validate_plan_json`] pays every time.
+pub fn validate_bundled_plan_json(plan_json: &Value) -> Result<ValidationReport, PlanError> {
+    Ok(collect_schema_violations(
+        bundled_plan_validator()?,
+        plan_json,
+    ))
 }
 
 /// Validate a parsed plan against a database schema snapshot.
@@ -63,7 +61,58 @@ pub fn validate_plan(
     plan_schema: &Value,
     schema: &DatabaseSchema,
 ) -> Result<ValidatedPlan, ValidationReport> {
-    let structural = match validate_plan_json(plan_json, plan_schema) {
+    finish_plan_validation(
+        plan_json,
+        validate_plan_json(plan_json, plan_schema),
+        schema,
+    )
+}
+
+/// Validate the plan end-to-end using the bundled `plan.json` JSON Schema.
+pub fn validate_bundled_plan(
+    plan_json: &Value,
+    schema: &DatabaseSchema,
+) -> Result<ValidatedPlan, ValidationReport> {
+    finish_plan_validation(plan_json, validate_bundled_plan_json(plan_json), schema)
+}
+
+fn bundled_plan_validator() -> Result<&'static JSONSchema, PlanError> {
+    static VALIDATOR: OnceLock<Result<JSONSchema, String>> = OnceLock::new();
+    VALIDATOR
+        .get_or_init(|| {
+            let plan_schema =
+                serde_json::to_value(plan_json_schema()).map_err(|err| err.to_string())?;
+            JSONSchema::compile(&plan_schema).map_err(|err| err.to_string())
+        })
+        .as_ref()
+        .map_err(|err| PlanError::Schema(err.clone()))
+}
+
+fn collect_schema_violations(compiled: &JSONSchema, plan_json: &Value) -> ValidationReport {
+    let mut report = ValidationReport::default();
+
+    if let Err(errors) = compiled.validate(plan_json) {
+        for error in errors {
+            let path = normalized_json_pointer(&error.instance_path.to_string());
+            report.push_error(ValidationIssue::new(
+                IssueSeverity::Error,
+                "schema_violation",
+                path,
+                error.to_string(),
+                None,
+            ));
+        }
+    }
+
+    report
+}
+
+fn finish_plan_validation(
+    plan_json: &Value,
+    structural: Result<ValidationReport, PlanError>,
+    schema: &DatabaseSchema,
+) -> Result<ValidatedPlan, ValidationReport> {
+    let structural = match structural {
         Ok(report) => report,
         Err(err) => {
             let mut report = ValidationReport::default();
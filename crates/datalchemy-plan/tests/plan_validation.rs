@@ -1,5 +1,7 @@
 use datalchemy_core::DatabaseSchema;
-use datalchemy_plan::{validate_plan, validate_plan_json};
+use datalchemy_plan::{
+    validate_bundled_plan, validate_bundled_plan_json, validate_plan, validate_plan_json,
+};
 use std::fs;
 use std::path::Path;
 
@@ -31,3 +33,27 @@ fn minimal_plan_validates_against_schema() {
         .expect("plan validation should succeed");
     assert!(validated.warnings.is_empty(), "unexpected warnings");
 }
+
+#[test]
+fn bundled_plan_schema_validates_minimal_plan() {
+    let plan_path =
+        Path::new(env!("CARGO_MANIFEST_DIR")).join("../../plans/examples/minimal.plan.json");
+    let schema_path = Path::new(env!("CARGO_MANIFEST_DIR"))
+        .join("../datalchemy-introspect/tests/golden/postgres_minimal.schema.json");
+
+    let plan_json = load_json(&plan_path);
+    let schema: DatabaseSchema =
+        serde_json::from_value(load_json(&schema_path)).expect("parse schema.json");
+
+    let structural = validate_bundled_plan_json(&plan_json).expect("compile bundled schema");
+    assert!(structural.errors.is_empty(), "structural errors found");
+
+    let mut invalid = plan_json.clone();
+    invalid["seed"] = serde_json::Value::String("not-a-number".to_string());
+    let report = validate_bundled_plan_json(&invalid).expect("reuse bundled schema");
+    assert!(!report.errors.is_empty(), "expected schema violation");
+
+    let validated =
+        validate_bundled_plan(&plan_json, &schema).expect("plan validation should succeed");
+    assert!(validated.warnings.is_empty(), "unexpected warnings");
+}